@@ -10,7 +10,6 @@ import shutil
 import subprocess
 import sys
 import time
-from logging.handlers import RotatingFileHandler
 from pathlib import Path
 
 SCRIPT_DIR = Path(__file__).resolve().parent
@@ -20,12 +19,40 @@ LOG_PATH = Path.home() / "Library" / "Logs" / "macpulse.log"
 
 logger = logging.getLogger("macpulse")
 
+# osascript arguments: message, then recipient
+_IMESSAGE_SCRIPT = """on run argv
+    tell application "Messages" to send (item 1 of argv) to buddy (item 2 of argv)
+end run"""
+
+# Reused encoder for the per-run metrics log line
+_COMPACT_JSON = json.JSONEncoder(separators=(",", ":"), default=str).encode
+
 # Commands used by this script — resolved at install time for cron PATH
-REQUIRED_COMMANDS = ["top", "vm_stat", "sysctl", "pmset", "hostname",
-                     "softwareupdate", "powermetrics", "osascript", "sudo"]
+REQUIRED_COMMANDS = ["top", "vm_stat", "pmset", "softwareupdate",
+                     "powermetrics", "osascript", "sudo"]
+
+# Accepted values of the cpu_source setting; see get_cpu_usage
+CPU_SOURCES = ("loadavg", "ticks", "top")
+
+# host_statistics(HOST_CPU_LOAD_INFO) layout, from <mach/host_info.h>
+_HOST_CPU_LOAD_INFO = 3
+_CPU_STATE_USER, _CPU_STATE_SYSTEM, _CPU_STATE_IDLE, _CPU_STATE_NICE = range(4)
+_CPU_STATE_MAX = 4
+
+# vm_stat lines counted as available memory: free, inactive, speculative
+_VM_STAT_PREFIXES = (b"Pages free:", b"Pages inactive:", b"Pages speculative:")
+
+# Output parsers for the metric collectors, compiled once per process
+_CPU_RE = re.compile(rb"(\d+\.?\d*)% user.*?(\d+\.?\d*)% sys")
+_TEMP_RE = re.compile(rb"(\d+\.?\d*)\s*(?:\xc2\xb0)?C")  # UTF-8 degree sign
+_POWERMETRICS_RE = re.compile(rb"CPU die temperature:\s*(\d+\.?\d*)\s*C")
+_UPDATE_LABEL_RE = re.compile(r"\* Label:\s*(.+)")
+_UPDATE_LINE_RE = re.compile(r"^\s*\*\s+(.+)", re.MULTILINE)
 
 
 def setup_logging():
+    from logging.handlers import RotatingFileHandler
+
     LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
     handler = RotatingFileHandler(LOG_PATH, maxBytes=1_000_000, backupCount=3)
     handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
@@ -44,6 +71,14 @@ DEFAULT_SETTINGS = {
     },
     "cooldown_minutes": 30,
     "software_update_timeout": 120,
+    "cpu_source": "loadavg",
+    "poll_tiers": {
+        "cpu": 1,
+        "memory": 1,
+        "temperature": 1,
+        "disk": 6,
+        "battery": 3,
+    },
     "checks": {
         "cpu": True,
         "memory": True,
@@ -76,141 +111,373 @@ def load_state():
 
 
 def save_state(state):
+    """Atomically write state."""
+    data = json.dumps(state).encode()
+    tmp = f"{STATE_PATH}.{os.getpid()}.tmp"
+    fd = None
     try:
-        with open(STATE_PATH, "w") as f:
-            json.dump(state, f)
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, STATE_PATH)
     except OSError as e:
         logger.error("Could not write state file: %s", e)
+        if fd is not None:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
 
 
 # ── Metric collectors ────────────────────────────────────────────────
+#
+# Each collector is split in two: _start_* spawns its subprocesses and
+# returns a finisher, which waits for them and parses their output. This
+# lets collect_metrics launch every command before waiting on any of them.
+# Finishers return None on timeout so one slow command can't abort the rest.
+# The public get_* functions run both halves back to back.
+#
+# The one exception is the first-run temperature probe: it tries each source
+# in turn, so it spawns from its finisher and runs after the other commands.
+
+
+def _spawn(cmd):
+    """Start cmd in the background with stdout and stderr captured."""
+    return subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
 
 
-def get_cpu_usage():
-    """Get CPU usage percentage from top."""
+def _wait(proc, timeout):
+    """Wait for a spawned process and return its (stdout, stderr).
+
+    Like subprocess.run, the process is killed and TimeoutExpired re-raised
+    if it doesn't finish in time.
+    """
     try:
-        out = subprocess.run(
-            ["top", "-l", "1", "-n", "0", "-stats", "cpu"],
-            capture_output=True, text=True, timeout=10,
-        )
+        return proc.communicate(timeout=timeout)
     except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.communicate()
+        raise
+
+
+def _done(value):
+    """Return a finisher for a value that is already known."""
+    return lambda: value
+
+
+def _read_cpu_ticks():
+    """Read cumulative (user, system, idle, nice) CPU ticks from the kernel.
+
+    Uses host_statistics(HOST_CPU_LOAD_INFO) from libSystem. Returns None
+    when the call is unavailable (e.g. not running on macOS).
+    """
+    import ctypes
+
+    try:
+        libc = ctypes.CDLL("/usr/lib/libSystem.dylib")
+    except OSError:
         return None
-    for line in out.stdout.splitlines():
-        if "CPU usage" in line:
-            m = re.search(r"(\d+\.?\d*)% user.*?(\d+\.?\d*)% sys", line)
+    libc.mach_host_self.restype = ctypes.c_uint32
+    ticks = (ctypes.c_uint32 * _CPU_STATE_MAX)()
+    count = ctypes.c_uint32(_CPU_STATE_MAX)
+    ret = libc.host_statistics(
+        libc.mach_host_self(), _HOST_CPU_LOAD_INFO, ticks, ctypes.byref(count),
+    )
+    if ret != 0:
+        return None
+    return list(ticks)
+
+
+def _parse_top(stdout):
+    """Parse user + system CPU percentage from top output."""
+    for line in stdout.splitlines():
+        if b"CPU usage" in line:
+            m = _CPU_RE.search(line)
             if m:
                 return round(float(m.group(1)) + float(m.group(2)), 1)
     return None
 
 
-def get_memory_usage():
-    """Get memory usage percentage from vm_stat and sysctl."""
-    # Total physical memory
-    try:
-        out = subprocess.run(
-            ["sysctl", "-n", "hw.memsize"],
-            capture_output=True, text=True, timeout=5,
-        )
-        total_bytes = int(out.stdout.strip())
-    except (ValueError, subprocess.TimeoutExpired):
-        return None
+def _start_top():
+    """Start sampling CPU usage with top (takes about a second)."""
+    proc = _spawn(["top", "-l", "1", "-n", "0", "-stats", "cpu"])
 
-    # vm_stat for page statistics
-    try:
-        out = subprocess.run(["vm_stat"], capture_output=True, text=True, timeout=5)
-    except subprocess.TimeoutExpired:
-        return None
+    def finish():
+        try:
+            stdout, _ = _wait(proc, 10)
+        except subprocess.TimeoutExpired:
+            return None
+        return _parse_top(stdout)
+    return finish
+
+
+def _get_cpu_usage_loadavg():
+    """Approximate CPU saturation as the 1-minute load average per core."""
+    ncpu = os.cpu_count() or 1
+    return round(min(os.getloadavg()[0] / ncpu * 100, 100.0), 1)
+
+
+def _start_cpu_usage(state=None, source="loadavg"):
+    """Start measuring CPU usage; see get_cpu_usage."""
+    if source not in CPU_SOURCES:
+        logger.warning("Ignoring invalid cpu_source %r, using loadavg", source)
+        source = "loadavg"
+    if source == "loadavg":
+        return _done(_get_cpu_usage_loadavg())
+    if source == "top":
+        return _start_top()
+    ticks = _read_cpu_ticks() if state is not None else None
+    if ticks is None:
+        return _start_top()
+    prev = state.get("_cpu_ticks")
+    state["_cpu_ticks"] = ticks
+    if not prev or len(prev) != len(ticks):
+        return _start_top()
+    delta = [now - before for now, before in zip(ticks, prev)]
+    total = sum(delta)
+    if total <= 0 or min(delta) < 0:
+        return _start_top()
+    busy = delta[_CPU_STATE_USER] + delta[_CPU_STATE_SYSTEM]
+    return _done(round(busy / total * 100, 1))
+
+
+def get_cpu_usage(state=None, source="loadavg"):
+    """Get CPU usage percentage.
+
+    source selects how it is measured:
+      "loadavg" - 1-minute load average per core, no subprocess (default)
+      "ticks"   - user + system share of kernel CPU ticks since the previous
+                  run, stored in state under "_cpu_ticks". Falls back to top
+                  when there is no usable previous sample (first run, reboot,
+                  counter wrap) or the counters cannot be read.
+      "top"     - user + system percentage sampled by top (about a second)
+    Any other value is logged and treated as "loadavg".
+    """
+    return _start_cpu_usage(state, source)()
+
+
+def _parse_vm_stat(stdout, total_bytes):
+    """Compute memory usage percentage from vm_stat output."""
     page_size = 16384  # default
-    m = re.search(r"page size of (\d+) bytes", out.stdout)
-    if m:
-        page_size = int(m.group(1))
+    i = stdout.find(b"page size of ")
+    if i != -1:
+        try:
+            page_size = int(stdout[i + 13:].split(None, 1)[0])
+        except (IndexError, ValueError):
+            pass
 
+    # Only three counters are used; stop reading once all have been seen.
+    # The byte after "Pages " tells the wanted lines apart.
     pages = {}
-    for line in out.stdout.splitlines():
-        m = re.match(r"(.+?):\s+(\d+)", line)
-        if m:
-            pages[m.group(1).strip()] = int(m.group(2))
-
-    free = pages.get("Pages free", 0)
-    inactive = pages.get("Pages inactive", 0)
-    speculative = pages.get("Pages speculative", 0)
-    available = (free + inactive + speculative) * page_size
+    for line in stdout.split(b"\n"):
+        if line.startswith(_VM_STAT_PREFIXES):
+            pages[line[6:7]] = int(line.rpartition(b":")[2].strip().rstrip(b".").split()[0])
+            if len(pages) == len(_VM_STAT_PREFIXES):
+                break
+
+    available = sum(pages.values()) * page_size
     used_pct = round((1 - available / total_bytes) * 100, 1)
     return used_pct
 
 
+def _start_memory_usage():
+    """Start measuring memory usage; see get_memory_usage."""
+    vm_stat = _spawn(["vm_stat"])
+
+    def finish():
+        # Total physical memory
+        try:
+            total_bytes = os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+        except (ValueError, OSError):
+            total_bytes = None
+        try:
+            stdout, _ = _wait(vm_stat, 5)
+        except subprocess.TimeoutExpired:
+            return None
+        if not total_bytes:
+            return None
+        return _parse_vm_stat(stdout, total_bytes)
+    return finish
+
+
+def get_memory_usage():
+    """Get memory usage percentage from vm_stat and physical memory size."""
+    return _start_memory_usage()()
+
+
 def get_disk_usage():
     """Get root disk usage percentage."""
-    usage = shutil.disk_usage("/")
-    return round(usage.used / usage.total * 100, 1)
+    st = os.statvfs("/")
+    return round((st.f_blocks - st.f_bfree) / st.f_blocks * 100, 1)
 
 
-def get_cpu_temperature():
-    """Get CPU temperature via powermetrics or osx-cpu-temp."""
-    # Try osx-cpu-temp first (no sudo needed)
-    for cmd in ["osx-cpu-temp", "/opt/homebrew/bin/osx-cpu-temp", "/usr/local/bin/osx-cpu-temp"]:
+def _start_osx_cpu_temp(cmd):
+    """Start reading CPU temperature from an osx-cpu-temp binary."""
+    try:
+        proc = _spawn([cmd])
+    except FileNotFoundError:
+        return _done(None)
+
+    def finish():
         try:
-            out = subprocess.run(
-                [cmd], capture_output=True, text=True, timeout=5,
-            )
-            if out.returncode == 0:
-                m = re.search(r"(\d+\.?\d*)\s*°?C", out.stdout)
-                if m and float(m.group(1)) > 0:
-                    return float(m.group(1))
-        except FileNotFoundError:
-            continue
+            stdout, _ = _wait(proc, 5)
+        except subprocess.TimeoutExpired:
+            logger.warning("%s timed out", cmd)
+            return None
+        if proc.returncode == 0:
+            m = _TEMP_RE.search(stdout)
+            if m and float(m.group(1)) > 0:
+                return float(m.group(1))
+        return None
+    return finish
+
 
-    # Try powermetrics (needs sudo / root)
+def _start_powermetrics_temp():
+    """Start reading CPU die temperature from powermetrics (needs sudo / root)."""
     try:
-        out = subprocess.run(
-            ["sudo", "-n", "powermetrics", "--samplers", "smc", "-i", "1", "-n", "1"],
-            capture_output=True, text=True, timeout=10,
-        )
-        if out.returncode == 0:
-            m = re.search(r"CPU die temperature:\s*(\d+\.?\d*)\s*C", out.stdout)
+        proc = _spawn(["sudo", "-n", "powermetrics", "--samplers", "smc", "-i", "1", "-n", "1"])
+    except FileNotFoundError:
+        return _done(None)
+
+    def finish():
+        try:
+            stdout, _ = _wait(proc, 10)
+        except subprocess.TimeoutExpired:
+            logger.warning("powermetrics timed out")
+            return None
+        if proc.returncode == 0:
+            m = _POWERMETRICS_RE.search(stdout)
             if m:
                 return float(m.group(1))
-    except FileNotFoundError:
-        pass
+        return None
+    return finish
+
 
+def _probe_cpu_temperature(cache):
+    """Find a working temperature source, record it in cache and read it."""
+    # Try osx-cpu-temp first (no sudo needed)
+    for cmd in ["osx-cpu-temp", "/opt/homebrew/bin/osx-cpu-temp", "/usr/local/bin/osx-cpu-temp"]:
+        path = shutil.which(cmd)
+        if path is None:
+            continue
+        temp = _start_osx_cpu_temp(path)()
+        if temp is not None:
+            cache["_temp_tool"] = path
+            return temp
+
+    # powermetrics has no CPU die sensor on Apple Silicon, so only try it on Intel
+    if os.uname().machine != "arm64":
+        temp = _start_powermetrics_temp()()
+        if temp is not None:
+            cache["_temp_tool"] = "powermetrics"
+            return temp
+
+    cache["_temp_tool"] = "none"
     return None
 
 
+def _start_cpu_temperature(state=None):
+    """Start reading CPU temperature; see get_cpu_temperature."""
+    cache = state if state is not None else {}
+    tool = cache.get("_temp_tool")
+    if tool == "none":
+        return _done(None)
+    if not tool:
+        # Probing is sequential, so it runs in the finisher (first run only)
+        return lambda: _probe_cpu_temperature(cache)
+
+    if tool == "powermetrics":
+        pending = _start_powermetrics_temp()
+    else:
+        pending = _start_osx_cpu_temp(tool)
+
+    def finish():
+        temp = pending()
+        if temp is None:
+            cache.pop("_temp_tool", None)
+        return temp
+    return finish
+
+
+def get_cpu_temperature(state=None):
+    """Get CPU temperature via powermetrics or osx-cpu-temp.
+
+    The first run probes for a working source and records it in state under
+    "_temp_tool" (an osx-cpu-temp path, "powermetrics" or "none"), so later
+    runs go straight to it. A cached source that stops working is forgotten
+    and probed again next run.
+    """
+    return _start_cpu_temperature(state)()
+
+
+def _parse_battery(stdout):
+    """Parse charge percentage and charging state from pmset output."""
+    # Battery line looks like: "-InternalBattery-0 (id=...)\t87%; discharging; ..."
+    i = stdout.find(b"%;")
+    if i == -1:
+        return None
+    try:
+        percent = int(stdout[:i].rsplit(None, 1)[-1])
+    except (IndexError, ValueError):
+        return None
+    state = stdout[i + 2:].split(b";", 1)[0].strip().decode("ascii", "replace")
+    if not state:
+        return None
+    return {"percent": percent, "state": state}
+
+
+def _start_battery_info():
+    """Start reading battery status; see get_battery_info."""
+    proc = _spawn(["pmset", "-g", "batt"])
+
+    def finish():
+        try:
+            stdout, _ = _wait(proc, 5)
+        except subprocess.TimeoutExpired:
+            return None
+        return _parse_battery(stdout)
+    return finish
+
+
 def get_battery_info():
     """Get battery charge percentage and charging state from pmset."""
-    out = subprocess.run(
-        ["pmset", "-g", "batt"], capture_output=True, text=True, timeout=5,
-    )
-    text = out.stdout
-    m = re.search(r"(\d+)%;\s*(\w[\w\s]*?);", text)
-    if m:
-        return {"percent": int(m.group(1)), "state": m.group(2).strip()}
+    return _start_battery_info()()
+
+
+def _parse_software_updates(output):
+    """Parse softwareupdate -l output (stdout and stderr combined)."""
+    combined = output.decode("utf-8", "replace")
+    if "No new software available" in combined:
+        return {"available": False, "details": None}
+    # Extract update labels (try both stdout and stderr)
+    updates = _UPDATE_LABEL_RE.findall(combined)
+    # Also try "* " prefixed lines as a fallback for older formats
+    if not updates:
+        updates = _UPDATE_LINE_RE.findall(combined)
+    if updates:
+        return {"available": True, "details": updates}
+    # No recognizable updates and no "no updates" message — treat as unknown
+    logger.warning("Could not parse softwareupdate output")
     return None
 
 
+def _start_software_updates(timeout=120):
+    """Start checking for software updates; see get_software_updates."""
+    proc = _spawn(["softwareupdate", "-l"])
+
+    def finish():
+        try:
+            stdout, stderr = _wait(proc, timeout)
+        except subprocess.TimeoutExpired:
+            logger.warning("softwareupdate timed out")
+            return None
+        return _parse_software_updates(stdout + stderr)
+    return finish
+
+
 def get_software_updates(timeout=120):
     """Check for available macOS software updates."""
-    try:
-        out = subprocess.run(
-            ["softwareupdate", "-l"],
-            capture_output=True, text=True, timeout=timeout,
-        )
-        combined = out.stdout + out.stderr
-        if "No new software available" in combined:
-            return {"available": False, "details": None}
-        # Extract update labels (try both stdout and stderr)
-        updates = re.findall(r"\* Label:\s*(.+)", combined)
-        # Also try "* " prefixed lines as a fallback for older formats
-        if not updates:
-            updates = re.findall(r"^\s*\*\s+(.+)", combined, re.MULTILINE)
-        if updates:
-            return {"available": True, "details": updates}
-        # No recognizable updates and no "no updates" message — treat as unknown
-        logger.warning("Could not parse softwareupdate output")
-        return None
-    except subprocess.TimeoutExpired:
-        logger.warning("softwareupdate timed out")
-        return None
+    return _start_software_updates(timeout)()
 
 
 def get_uptime_and_load():
@@ -267,11 +534,15 @@ def filter_by_cooldown(alerts, state, cooldown_minutes):
 
 
 def send_imessage(recipient, message):
-    """Send an iMessage via osascript."""
-    escaped = message.replace("\\", "\\\\").replace('"', '\\"').replace("\n", '" & return & "')
-    escaped_rcpt = recipient.replace("\\", "\\\\").replace('"', '\\"')
-    script = f'tell application "Messages" to send ("{escaped}") to buddy "{escaped_rcpt}"'
-    result = subprocess.run(["osascript", "-e", script], capture_output=True, text=True, timeout=30)
+    """Send an iMessage via osascript.
+
+    Message and recipient are passed as script arguments rather than
+    interpolated into the AppleScript source, so they need no escaping.
+    """
+    result = subprocess.run(
+        ["osascript", "-e", _IMESSAGE_SCRIPT, message, recipient],
+        capture_output=True, text=True, timeout=30,
+    )
     if result.returncode != 0:
         logger.error("Failed to send iMessage: %s", result.stderr.strip())
         return False
@@ -281,23 +552,85 @@ def send_imessage(recipient, message):
 # ── Main ─────────────────────────────────────────────────────────────
 
 
-def collect_metrics(checks, settings=None):
-    """Collect all enabled metrics."""
+def _poll_tier(tiers, name):
+    """Return the poll tier for a metric, treating invalid values as 1."""
+    tier = tiers.get(name, 1)
+    if not isinstance(tier, int) or tier < 1:
+        logger.warning("Ignoring invalid poll_tiers value for %s: %r", name, tier)
+        return 1
+    return tier
+
+
+def collect_metrics(checks, settings=None, state=None):
+    """Collect all enabled metrics.
+
+    The collectors spend nearly all their time waiting on subprocesses, so
+    every command is spawned before any is waited on and the total wall time
+    is that of the slowest one.
+    Collectors that keep samples between runs read and update state.
+
+    With state, metrics are polled according to settings["poll_tiers"]: a
+    metric with tier N is collected every Nth run, and its last value (kept
+    in state["_last"], with the sample's run number and time in
+    state["_last_run"] and state["_last_ts"]) is reused in between. Runs
+    are counted in state["_run_count"], whatever the schedule. A cached
+    value is measured again early if it was over its threshold, or if it
+    is older than N times the gap between earlier runs (state["_run_gap"]),
+    e.g. after the Mac was asleep.
+    """
     settings = settings or {}
+    timeout = settings.get("software_update_timeout", 120)
+    cpu_source = settings.get("cpu_source", "loadavg")
+    tiers = settings.get("poll_tiers", DEFAULT_SETTINGS["poll_tiers"])
+    thresholds = {**DEFAULT_SETTINGS["thresholds"], **settings.get("thresholds", {})}
+    now = time.time()
+    run = 0
+    gap = None
+    last = {}
+    last_ts = {}
+    last_run = {}
+    if state is not None:
+        run = state.get("_run_count", 0) + 1
+        prev_time = state.get("_run_time")
+        if prev_time is not None:
+            gap = state.get("_run_gap") or now - prev_time
+            state["_run_gap"] = now - prev_time
+        state["_run_count"] = run
+        state["_run_time"] = now
+        last = state.get("_last", {})
+        last_ts = state.get("_last_ts", {})
+        last_run = state.get("_last_run", {})
+    over = {m for m, _ in check_thresholds(last, thresholds, checks)}
+    collectors = (
+        ("cpu", lambda: _start_cpu_usage(state, cpu_source)),
+        ("memory", _start_memory_usage),
+        ("disk", lambda: _done(get_disk_usage())),
+        ("temperature", lambda: _start_cpu_temperature(state)),
+        ("battery", _start_battery_info),
+        ("software_update", lambda: _start_software_updates(timeout)),
+    )
     metrics = {}
-    if checks.get("cpu"):
-        metrics["cpu"] = get_cpu_usage()
-    if checks.get("memory"):
-        metrics["memory"] = get_memory_usage()
-    if checks.get("disk"):
-        metrics["disk"] = get_disk_usage()
-    if checks.get("temperature"):
-        metrics["temperature"] = get_cpu_temperature()
-    if checks.get("battery"):
-        metrics["battery"] = get_battery_info()
-    if checks.get("software_update"):
-        timeout = settings.get("software_update_timeout", 120)
-        metrics["software_update"] = get_software_updates(timeout=timeout)
+    enabled = []
+    for name, start in collectors:
+        if not checks.get(name):
+            continue
+        tier = _poll_tier(tiers, name)
+        if (tier > 1 and name in last and name in last_run and name not in over
+                and run - last_run[name] < tier
+                and gap and now - last_ts.get(name, 0) < tier * gap):
+            metrics[name] = last[name]
+        else:
+            enabled.append((name, start, tier))
+    if enabled:
+        pending = {name: start() for name, start, _ in enabled}
+        fresh = {name: finish() for name, finish in pending.items()}
+        metrics.update(fresh)
+        # Only metrics that can be reused are cached
+        cached = [name for name, _, tier in enabled if tier > 1]
+        if state is not None and cached:
+            state["_last"] = {**last, **{name: fresh[name] for name in cached}}
+            state["_last_ts"] = {**last_ts, **{name: now for name in cached}}
+            state["_last_run"] = {**last_run, **{name: run for name in cached}}
     metrics["load"] = get_uptime_and_load()
     return metrics
 
@@ -344,24 +677,39 @@ def run_monitor():
     recipient = settings.get("recipient", "")
     cooldown = settings.get("cooldown_minutes", 30)
 
-    metrics = collect_metrics(checks, settings)
+    state = load_state()
+
+    # A metric that alerted within the cooldown window can't alert again this
+    # run, so don't pay for collecting it
+    now = time.time()
+    suppressed = {m for m, enabled in checks.items()
+                  if enabled and now - state.get(m, 0) < cooldown * 60}
+    if suppressed:
+        logger.info("Skipping metrics in cooldown: %s", sorted(suppressed))
+        # Forget their pre-cooldown samples so they are measured afresh
+        # rather than re-alerting on old data once the cooldown ends
+        if "_last" in state:
+            state["_last"] = {m: v for m, v in state["_last"].items() if m not in suppressed}
+    effective_checks = {k: v and k not in suppressed for k, v in checks.items()}
+
+    metrics = collect_metrics(effective_checks, settings, state)
+    save_state(state)
     print_metrics(metrics)
-    logger.info("Metrics: %s", json.dumps(metrics, default=str))
+    logger.info("Metrics: %s", _COMPACT_JSON(metrics))
 
     alerts = check_thresholds(metrics, thresholds, checks)
     if not alerts:
         logger.info("All metrics within thresholds.")
         return
 
-    state = load_state()
     to_send = filter_by_cooldown(alerts, state, cooldown)
     if not to_send:
         logger.info("Alerts suppressed by cooldown: %s", [a[0] for a in alerts])
         return
 
-    hostname = subprocess.run(
-        ["hostname", "-s"], capture_output=True, text=True
-    ).stdout.strip() or "mac-server"
+    import socket
+
+    hostname = socket.gethostname().split(".")[0] or "mac-server"
     body = f"[MacPulse] {hostname}\n" + "\n".join(f"- {msg}" for _, msg in to_send)
 
     if not recipient:
@@ -419,12 +767,15 @@ def main():
     parser.add_argument("--install", action="store_true", help="print a crontab entry for scheduling")
     args = parser.parse_args()
 
+    # --install only prints; it doesn't log
+    if args.install:
+        print_install()
+        return
+
     setup_logging()
 
     if args.test:
         test_alert()
-    elif args.install:
-        print_install()
     else:
         run_monitor()
 